@@ -0,0 +1,287 @@
+# =========================
+# Imports
+# =========================
+import copy
+
+import streamlit as st
+
+import factory_core
+from factory_core import STATIONS, RANDOM_SEED, fmt_duration, run_replications, simulate, summarize
+
+
+# =========================
+# Page & minimal styling
+# =========================
+st.set_page_config(page_title="Factory Line UI", layout="wide")
+st.markdown(
+    """
+    <style>
+      .appview-container .main .block-container{
+        max-width: 96vw;
+        padding-top: 0.75rem;
+        padding-bottom: 1.5rem;
+      }
+
+      
+      section[data-testid="stSidebar"] { width: 300px; }
+      @media (min-width: 1400px){
+        section[data-testid="stSidebar"] { width: 320px; }
+      }
+      h1, h2, h3 { margin-top: .4rem; margin-bottom: .5rem; }
+      .caption { opacity:.7; font-size:0.9rem; }
+
+      /* Utilization bars: static styling lives here, per-run markup only sets height/color */
+      .util-title { font-size:16px; font-weight:bold; text-align:center; }
+      .util-chart { display:flex; justify-content:center; align-items:flex-end; gap:40px; height:270px; }
+      .util-col { display:flex; flex-direction:column; align-items:center; justify-content:flex-end; }
+      .util-bn { color:#E11D48; font-size:10px; font-weight:bold; }
+      .util-val { font-size:11px; font-weight:bold; }
+      .util-bar { width:60px; box-sizing:border-box; border:0.6px solid #333; }
+      .util-bar.bn { border:2px solid #E11D48; }
+      .util-name { margin-top:4px; font-size:12px; }
+    </style>
+    """,
+    unsafe_allow_html=True,
+)
+
+st.title("Factory Line Simulation")
+st.caption("Use the sidebar to configure the run.")
+
+
+# =========================
+# UI state
+# =========================
+# Per-session copies: the sidebar edits these in place, while the module-level
+# defaults in factory_core are shared by every session
+RANGES = copy.deepcopy(factory_core.RANGES)
+VARIABILITY = dict(factory_core.VARIABILITY)
+
+# Repeat clicks with identical settings (and a locked seed) reuse the last result
+simulate_cached = st.cache_data(show_spinner=False)(simulate)
+run_replications_cached = st.cache_data(show_spinner=False)(run_replications)
+
+# SimPy costs ~27 µs per item per replication, so ~1 s of serial work is where
+# the pool's worker startup is paid back on two or more cores
+POOL_MIN_ITEM_REPS = 40_000
+
+
+# =========================
+# Helpers
+# =========================
+def util_color(u_pct: float) -> str:
+    # <70% light blue, 70–90% blue, >90% coral/red
+    if u_pct < 70: return "#9EC5FE"
+    if u_pct < 90: return "#5B8DEF"
+    return "#F45B69"
+
+def utilization_html(stations, utils_pct, bottlenecks, title="Station Utilization — Single Run"):
+    # Plain flexbox bars at 2px per percent, so the plot area spans 0–110%
+    columns = []
+    for station, u in zip(stations, utils_pct):
+        is_bn = station in bottlenecks
+        bar_class = "util-bar bn" if is_bn else "util-bar"
+        columns.append(
+            '<div class="util-col">'
+            + ('<div class="util-bn">BN</div>' if is_bn else "")
+            + f'<div class="util-val">{u:.1f}%</div>'
+            f'<div class="{bar_class}" style="height:{min(u, 110) * 2:.0f}px; background:{util_color(u)}"></div>'
+            f'<div class="util-name">{station}</div>'
+            '</div>'
+        )
+    return f'<div class="util-title">{title}</div><div class="util-chart">' + "".join(columns) + '</div>'
+
+
+# =========================
+# Sidebar controls
+# =========================
+with st.sidebar:
+    # A form batches edits: changing settings does not rerun the script until Run
+    with st.form("settings"):
+        st.header("Run Settings")
+
+        NUM_ITEMS = st.slider(
+            "Number of items", 1, 1000, 100, 10,
+            help="How many parts to simulate this run"
+        )
+
+        mode = st.selectbox(
+            "Mode", ["max", "eff"], index=0,
+            help="`max`: fastest feasible cycle time. `eff`: pick a cycle time to hit target line-balancing efficiency"
+        )
+
+        # Form widgets only update on submit, so η and the seed are always shown
+        # and only applied when their mode/checkbox is selected
+        eta = st.slider(
+            "Target efficiency η", 0.60, 1.00, 0.85,
+            help="Desired design efficiency (0–1) in `eff` mode. Higher η → tighter cycle time"
+        )
+
+        slack = st.slider(
+            "Slack (sec)", 0.0, 2.0, 0.5, 0.1,
+            help="Extra seconds added to the selected cycle time before clamping per-station. Small slack reduces starvation/blocking"
+        )
+
+        imbalance_factor = st.slider(
+            "Line Imbalance Factor", 0.0, 2.0, 0.0, 0.1,
+            help="Scales spread between faster/slower stations (creates persistent utilization differences)"
+        )
+
+        engine = st.selectbox(
+            "Engine", ["Fast", "SimPy"], index=0,
+            help="`Fast`: flow-shop recurrence compiled with Numba when available. `SimPy`: event-level discrete-event model"
+        )
+
+        replications = st.slider(
+            "Replications", 1, 50, 1, 1,
+            help="Independent runs with different seeds. Above 1, KPIs show the mean ± 95% confidence interval"
+        )
+
+        st.header("Randomness Settings")
+
+        randomness_mode = st.selectbox(
+            "Randomness mode",
+            ["Off", "Arrivals only", "Stations only", "All randomness"],
+            index=3,
+            help="Choose which types of randomness to include in the simulation"
+        )
+
+        arrival_jitter = st.slider(
+            "Arrival jitter (± fraction)", 0.0, 0.8, 0.0, 0.05,
+            help="Randomness in mining interval. 0.0 = regular arrivals; >0 = bursty exponential arrivals"
+        )
+
+        lock_seed = st.checkbox(
+            "Lock random seed", value=RANDOM_SEED is not None,
+            help="Reproduce the same random run. Runs with a locked seed are cached, so repeat clicks are instant"
+        )
+
+        seed = st.number_input(
+            "Seed", 0, 2**32 - 1, 42 if RANDOM_SEED is None else RANDOM_SEED, 1,
+            help="Seed for the random number generator, used when the seed is locked"
+        )
+
+        with st.expander("Station Variability (± fraction)", expanded=False):
+            st.caption("Per-job processing randomness (treated as CV). Higher → more job-to-job variation")
+            for station in VARIABILITY.keys():
+                VARIABILITY[station] = st.slider(
+                    f"{station}", 0.0, 0.50,
+                    value=float(VARIABILITY[station]),
+                    step=0.01,
+                    key=f"{station}_var",
+                    help="Coefficient of variation for this station’s processing time"
+                )
+
+        st.header("Station Settings")
+        with st.expander("Per-Station Ranges (sec/item)", expanded=False):
+            st.caption("Bounds for each station’s process time (sec/item). Keep min ≤ max")
+            for station in STATIONS:
+                c1, c2 = st.columns(2)
+                with c1:
+                    min_val = st.number_input(
+                        f"{station} min",
+                        value=float(RANGES[station]["min"]),
+                        step=1.0,
+                        help="Lower bound on this station’s process time"
+                    )
+                with c2:
+                    max_val = st.number_input(
+                        f"{station} max",
+                        value=float(RANGES[station]["max"]),
+                        step=1.0,
+                        help="Upper bound on this station’s process time"
+                    )
+                # auto-correct if user inverted bounds
+                if min_val > max_val:
+                    min_val, max_val = max_val, min_val
+                RANGES[station]["min"] = min_val
+                RANGES[station]["max"] = max_val
+
+        run = st.form_submit_button("Run Simulation", type="primary")
+
+
+# =========================
+# Results
+# =========================
+st.subheader("Results")
+if run:
+    # Apply sidebar settings
+    NUM_ITEMS = int(NUM_ITEMS)
+    IMBALANCE_FACTOR = float(imbalance_factor)
+    USE_SIMPY = engine == "SimPy"
+    RANDOM_SEED = int(seed) if lock_seed else None
+
+    if randomness_mode == "Off":
+        ENABLE_JITTER = False
+        ARRIVAL_JITTER = 0.0
+    elif randomness_mode == "Arrivals only":
+        ENABLE_JITTER = False
+        ARRIVAL_JITTER = float(arrival_jitter)
+    elif randomness_mode == "Stations only":
+        ENABLE_JITTER = True
+        ARRIVAL_JITTER = 0.0
+    elif randomness_mode == "All randomness":
+        ENABLE_JITTER = True
+        ARRIVAL_JITTER = float(arrival_jitter)
+
+    # Only deterministic or seeded runs are worth caching; a fresh random run
+    # must not replay the previous result
+    stochastic = ENABLE_JITTER or ARRIVAL_JITTER > 0.0
+    cacheable = RANDOM_SEED is not None or not stochastic
+
+    # Recalculate station times with current mode/eta/slack and run the simulation
+    params = dict(
+        num_items=NUM_ITEMS,
+        ranges=tuple((s, RANGES[s]["min"], RANGES[s]["max"]) for s in STATIONS),
+        variability=tuple(VARIABILITY.items()),
+        mode=mode, eta=eta if mode == "eff" else None, slack=slack, imbalance=IMBALANCE_FACTOR,
+        enable_jitter=ENABLE_JITTER, arrival_jitter=ARRIVAL_JITTER, use_simpy=USE_SIMPY,
+    )
+    if replications == 1:
+        sim = simulate_cached if cacheable else simulate
+        results = [sim(seed=RANDOM_SEED, **params)]
+    else:
+        # Each spawned worker re-imports factory_core (~0.5 s), far more than a
+        # Fast-engine batch or a small SimPy one takes serially, so only large
+        # SimPy batches go to the process pool
+        parallel = USE_SIMPY and NUM_ITEMS * replications >= POOL_MIN_ITEM_REPS
+        reps = run_replications_cached if cacheable else run_replications
+        results = reps(params, replications, seed=RANDOM_SEED, processes=None if parallel else 1)
+
+    # ---- KPIs ----
+    makespan, makespan_ci = summarize(results, "makespan")
+    sim_throughput, throughput_ci = summarize(results, "throughput")
+    runtime_eff, runtime_eff_ci = summarize(results, "runtime_eff")
+    bottlenecks = results[0].bottlenecks
+
+    if replications > 1:
+        makespan_txt = f"{fmt_duration(makespan)} ± {fmt_duration(makespan_ci)}"
+        throughput_txt = f"{sim_throughput:.3f} ± {throughput_ci:.3f} items/s"
+        runtime_eff_txt = f"{runtime_eff*100:.1f} ± {runtime_eff_ci*100:.1f}%"
+    else:
+        makespan_txt = fmt_duration(makespan)
+        throughput_txt = f"{sim_throughput:.3f} items/s"
+        runtime_eff_txt = f"{runtime_eff*100:.1f}%"
+
+    kpi1, kpi2, kpi3 = st.columns(3)
+    with kpi1:
+        st.metric("Makespan", makespan_txt, help="Total simulated time to finish all items")
+    with kpi2:
+        st.metric("Throughput", throughput_txt, help="Average completion rate in items per second")
+    with kpi3:
+        st.metric("Runtime Efficiency", runtime_eff_txt, help="Average utilization across stations during the run")
+
+    # ---- Utilization chart ----
+    plot_stations = ["Smelter", "Constructor", "Painter", "Packager"]
+    utils_pct = [
+        sum(
+            (r.station_stats[s].busy / r.makespan) * 100 if r.makespan > 0 else 0.0
+            for r in results
+        ) / len(results)
+        for s in plot_stations
+    ]
+    title = "Station Utilization — Single Run" if replications == 1 else f"Station Utilization — Mean of {replications} Runs"
+    st.markdown(utilization_html(plot_stations, utils_pct, bottlenecks, title=title), unsafe_allow_html=True)
+    st.caption("Color scheme: Light blue < 70% (under-loaded), Blue 70–90% (healthy), Red > 90% (over-loaded). 'BN' marks the bottleneck station")
+
+else:
+    st.info("This space will show KPIs and the utilization chart after you click **Run Simulation**.")
\ No newline at end of file
@@ -0,0 +1,447 @@
+# Simulation core for the factory line: station-time calculator and the
+# closed-form, Numba/NumPy and SimPy engines. No Streamlit dependency, so it can
+# be imported from notebooks, scripts and worker processes, or run on its own
+# (e.g. under PyPy) with `python -m factory_core '<simulate() kwargs as JSON>'`.
+
+# =========================
+# Imports
+# =========================
+import json
+import math
+import multiprocessing
+import os
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from functools import partial
+from typing import NamedTuple
+
+import numpy as np
+import simpy
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # numba is optional; without it the vectorized NumPy path is used
+    HAVE_NUMBA = False
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+# =========================
+# Simulation config
+# =========================
+STATIONS = ["Miner", "Smelter", "Constructor", "Painter", "Packager"]
+
+IMBALANCE_FACTOR = 0.0        # spreads stations faster/slower around the center
+
+# Per-station min/max process times (seconds per item)
+RANGES = {
+    "Miner":       {"min": 20, "max": 45},
+    "Smelter":     {"min": 25, "max": 70},
+    "Constructor": {"min": 15, "max": 50},
+    "Painter":     {"min": 12, "max": 40},
+    "Packager":    {"min": 10, "max": 35},
+}
+
+# Per-station variability as ± fraction (treated as CV for lognormal)
+VARIABILITY = {
+    "Smelter":     0.05,  # 5%
+    "Constructor": 0.03,  # 3%
+    "Painter":     0.02,  # 2%
+    "Packager":    0.01,  # 1%
+}
+
+# Reproducibility (optional)
+RANDOM_SEED = None  # set to an int (e.g., 42) to lock randomness, or leave as None
+
+# Quiet logging. Per-item call sites check VERBOSE first so the f-string and
+# get_time() are never evaluated when logging is off
+VERBOSE = False
+def log(*args, **kwargs):
+    if VERBOSE:
+        print(*args, **kwargs)
+
+
+# =========================
+# Helpers
+# =========================
+def clamp(x, a, b):
+    return max(a, min(b, x))
+
+def get_time(seconds):
+    seconds = int(round(seconds))
+    minutes = seconds // 60
+    seconds = seconds % 60
+    return f"{minutes}m {seconds}s"
+
+def fmt_duration(seconds: float) -> str:
+    seconds = int(round(seconds))
+    h = seconds // 3600
+    m = (seconds % 3600) // 60
+    s = seconds % 60
+    if h > 0:
+        return f"{h}h {m}m {s}s"
+    if m > 0:
+        return f"{m}m {s}s"
+    return f"{s}s"
+
+
+# =========================
+# Calculator: station times
+# =========================
+def set_machine_times(mode="max", eta=None, slack=0.5, ranges=None, imbalance=None):
+    ranges = RANGES if ranges is None else ranges
+    imbalance = IMBALANCE_FACTOR if imbalance is None else imbalance
+
+    # One pass gathers the bounds and the three reductions the cycle depends on
+    min_times, max_times = [], []
+    total_work_content = 0.0
+    fastest_feasible_cycle = -math.inf
+    slowest_feasible_cycle = math.inf
+    for s in STATIONS:
+        lo, hi = ranges[s]["min"], ranges[s]["max"]
+        min_times.append(lo)
+        max_times.append(hi)
+        total_work_content += lo
+        if lo > fastest_feasible_cycle:
+            fastest_feasible_cycle = lo
+        if hi < slowest_feasible_cycle:
+            slowest_feasible_cycle = hi
+    num_stations = len(STATIONS)
+
+    if fastest_feasible_cycle > slowest_feasible_cycle:
+        raise ValueError("Infeasible ranges: no overlap between min and max settings")
+
+    if mode == "max":
+        cycle = fastest_feasible_cycle
+    elif mode == "eff":
+        if not (eta and 0 < eta <= 1):
+            raise ValueError("Need eta in (0,1] when mode='eff'")
+        requested_cycle = total_work_content / (num_stations * eta)
+        cycle = clamp(requested_cycle, fastest_feasible_cycle, slowest_feasible_cycle)
+    else:
+        raise ValueError("mode must be 'max' or 'eff'")
+
+    # Apply slack then distribute imbalance linearly across stations around center,
+    # clamping each station into its own [min, max] (same order as STATIONS)
+    offsets = 1.0 + imbalance * (np.arange(num_stations) - num_stations/2) / num_stations
+    adjusted = np.maximum(min_times, np.minimum(max_times, (cycle + slack) * offsets))
+    chosen = dict(zip(STATIONS, adjusted.tolist()))
+
+    efficiency = total_work_content / (num_stations * cycle)
+    bottlenecks = [s for s, lo in zip(STATIONS, min_times) if lo == fastest_feasible_cycle]
+
+    throughput = 1.0 / cycle
+    return chosen, cycle, throughput, efficiency, bottlenecks
+
+
+# =========================
+# Fast path: flow-shop recurrence
+# =========================
+# Single-capacity stations fed FIFO from unbounded buffers obey
+#   done[s][i] = max(done[s][i-1], done[s-1][i]) + proc[s][i]
+# so a stochastic run is one pass over items with a "next free" time per station.
+@njit(cache=True)
+def _lognormal_params(mean, cv):
+    # (mu, sigma) of a lognormal with the given mean and coefficient of variation.
+    # Runs once per station per run, never per item, so the exact form is kept:
+    # the Taylor shortcut sigma ~ cv*(1 - cv²/4) is off by 8e-7 at cv=0.05 but
+    # by 0.77% at the slider's cv=0.5, for no measurable saving.
+    sigma = math.sqrt(math.log1p(cv*cv))
+    mu = math.log(mean) - 0.5 * sigma * sigma
+    return mu, sigma
+
+@njit(cache=True)
+def _seed_line(seed):
+    np.random.seed(seed)
+
+@njit(cache=True)
+def _simulate_line(num_items, times, cvs, arrival_mean, arrival_jitter_on):
+    n = times.shape[0]
+    mus = np.zeros(n)
+    sigmas = np.zeros(n)
+    for s in range(n):
+        if cvs[s] > 0.0:
+            mus[s], sigmas[s] = _lognormal_params(times[s], cvs[s])
+
+    next_free = np.zeros(n)
+    busy = np.zeros(n)
+    counts = np.zeros(n, dtype=np.int64)
+    arrival = 0.0
+    for i in range(num_items):
+        prev_done = arrival
+        for s in range(n):
+            if cvs[s] > 0.0:
+                dt = np.random.lognormal(mus[s], sigmas[s])
+            else:
+                dt = times[s]
+            start = max(next_free[s], prev_done)
+            prev_done = start + dt
+            next_free[s] = prev_done
+            busy[s] += dt
+            counts[s] += 1
+
+        if arrival_jitter_on:
+            arrival += np.random.exponential(arrival_mean)
+        else:
+            arrival += arrival_mean
+
+    return next_free[n - 1], busy, counts
+
+def _sample_station_times(rng, num_items, times, cvs):
+    # One batched draw per station: row s holds every item's time at station s
+    proc = np.empty((times.shape[0], num_items))
+    for s in range(times.shape[0]):
+        if cvs[s] > 0.0:
+            mu, sigma = _lognormal_params(times[s], cvs[s])
+            proc[s] = rng.lognormal(mu, sigma, num_items)
+        else:
+            proc[s] = times[s]
+    return proc
+
+def _sample_arrivals(rng, num_items, arrival_mean, arrival_jitter_on):
+    # Arrival time of each item at the first station: every arrival_mean seconds,
+    # or exponential gaps with that mean when arrival jitter is on
+    if not arrival_jitter_on:
+        return np.arange(num_items) * arrival_mean
+    arrivals = np.zeros(num_items)
+    np.cumsum(rng.exponential(arrival_mean, max(num_items - 1, 0)), out=arrivals[1:])
+    return arrivals
+
+def _simulate_line_numpy(num_items, times, cvs, arrival_mean, arrival_jitter_on, rng):
+    # Same recurrence without Numba: pre-sample every station time, then solve
+    # each station row with a prefix max. With P = cumsum(proc), the row
+    # done[i] = max(done[i-1], ready[i]) + proc[i] becomes
+    # done - P = maximum.accumulate(ready - (P - proc)).
+    n = times.shape[0]
+    if num_items <= 0:
+        return 0.0, np.zeros(n), np.zeros(n, dtype=np.int64)
+    proc = _sample_station_times(rng, num_items, times, cvs)
+    done = _sample_arrivals(rng, num_items, arrival_mean, arrival_jitter_on)
+
+    for s in range(n):
+        csum = np.cumsum(proc[s])
+        done = np.maximum.accumulate(done - (csum - proc[s])) + csum
+
+    counts = np.full(n, num_items, dtype=np.int64)
+    return done[-1], proc.sum(axis=1), counts
+
+
+# =========================
+# SimPy processes
+# =========================
+# Buffers are plain counters (simpy.Container): items are interchangeable and
+# FIFO order is implied, so a station's running count doubles as the item number.
+# Process and inter-arrival times are sampled up front, one value per item.
+# Stats live in per-run lists indexed by station id rather than a dict per station.
+def machine(name, idx, env, times, input_buffer, output_buffer, busy, counts,
+            handoff=None, arrivals=None):
+    for i, actual_time in enumerate(times):
+        if arrivals is None:
+            yield input_buffer.get(1)
+        elif arrivals[i] > env.now:
+            # First station: items arrive on a precomputed schedule, so there is
+            # no source process or input buffer, just a wait for the next arrival
+            yield env.timeout(arrivals[i] - env.now)
+
+        yield env.timeout(actual_time)
+
+        counts[idx] += 1
+        busy[idx]   += actual_time
+        if VERBOSE:
+            log(f"{name} finished item {counts[idx]} at {get_time(env.now)}")
+
+        if output_buffer is not None:
+            yield output_buffer.put(1)
+        else:
+            handoff(env.now)
+
+def _simulate_line_simpy(num_items, times, cvs, arrival_mean, arrival_jitter_on, rng):
+    n = times.shape[0]
+    if num_items <= 0:
+        # Nothing would ever trigger the completion event
+        return 0.0, [0.0] * n, [0] * n
+    samples = _sample_station_times(rng, num_items, times, cvs).tolist()
+    arrivals = _sample_arrivals(rng, num_items, arrival_mean, arrival_jitter_on).tolist()
+    busy = [0.0] * n
+    counts = [0] * n
+
+    # The Packager has no downstream consumer, so it needs no process or buffer:
+    # fed FIFO by the Painter, it is just a "next free" timer advanced per item
+    packager_times = iter(samples[3])
+    packager_free = 0.0
+    def packager(now):
+        nonlocal packager_free
+        actual_time = next(packager_times)
+        packager_free = max(packager_free, now) + actual_time
+        counts[3] += 1
+        busy[3]   += actual_time
+        if VERBOSE:
+            log(f"Item {counts[3]} COMPLETED at {get_time(packager_free)}")
+        if counts[3] == num_items:
+            done.succeed()
+
+    env = simpy.Environment()
+    done = env.event()
+    queue_B = simpy.Container(env)
+    queue_C = simpy.Container(env)
+
+    log("=== Starting production ===")
+    env.process(machine("Smelter",     0, env, samples[0], None,    queue_B, busy, counts,
+                        arrivals=arrivals))
+    env.process(machine("Constructor", 1, env, samples[1], queue_B, queue_C, busy, counts))
+    env.process(machine("Painter",     2, env, samples[2], queue_C, None,    busy, counts,
+                        handoff=packager))
+
+    # Stop as soon as the last item is handed over rather than relying on the
+    # event queue draining
+    env.run(until=done)
+    log(f"=== Production completed at {get_time(packager_free)} ===")
+    return packager_free, busy, counts
+
+def run_simulation(num_items, chosen_times, variability, enable_jitter, arrival_jitter,
+                   seed=None, use_simpy=False):
+    # The Miner is the source; every other station is a processing stage
+    names = STATIONS[1:]
+    miner_time = chosen_times["Miner"]
+    times = np.array([chosen_times[name] for name in names], dtype=np.float64)
+
+    if not enable_jitter and arrival_jitter == 0.0:
+        # Fully deterministic line: regular arrivals every miner_time and fixed
+        # station times. With unbounded FIFO buffers the makespan is closed-form,
+        # the slowest of (arrival interval, stations) paced N-1 times plus one
+        # pass through every station, so there is nothing to simulate.
+        pace = max(chosen_times.values())
+        flow_time = sum(chosen_times.values()) - miner_time
+        makespan = (num_items - 1) * pace + flow_time if num_items > 0 else 0.0
+        busy = num_items * times
+        counts = [num_items] * len(names)
+    else:
+        cvs = np.array([variability.get(name, 0.0) if enable_jitter else 0.0 for name in names])
+        arrival_mean = miner_time * (1.0 + arrival_jitter)
+        if use_simpy:
+            makespan, busy, counts = _simulate_line_simpy(
+                num_items, times, cvs, arrival_mean, arrival_jitter > 0.0,
+                np.random.default_rng(seed),
+            )
+        elif HAVE_NUMBA:
+            if seed is not None:
+                _seed_line(seed)
+            makespan, busy, counts = _simulate_line(
+                num_items, times, cvs, arrival_mean, arrival_jitter > 0.0
+            )
+        else:
+            makespan, busy, counts = _simulate_line_numpy(
+                num_items, times, cvs, arrival_mean, arrival_jitter > 0.0,
+                np.random.default_rng(seed),
+            )
+
+    station_stats = {
+        name: StationStats(int(counts[k]), float(busy[k]))
+        for k, name in enumerate(names)
+    }
+    return float(makespan), station_stats
+
+
+# =========================
+# Simulation entry point
+# =========================
+class StationStats(NamedTuple):
+    count: int
+    busy: float
+
+
+@dataclass
+class SimResult:
+    makespan: float
+    throughput: float
+    runtime_eff: float
+    station_stats: dict
+    chosen_times: dict
+    cycle_time: float
+    efficiency: float
+    bottlenecks: list
+
+
+def simulate(num_items, ranges, variability, mode, eta, slack, imbalance,
+             enable_jitter, arrival_jitter, seed=None, use_simpy=False):
+    # Pure function of its (hashable) arguments so results can be memoized:
+    # ranges is a tuple of (station, min, max), variability of (station, cv)
+    ranges = {s: {"min": lo, "max": hi} for s, lo, hi in ranges}
+    chosen, cycle, _, efficiency, bottlenecks = set_machine_times(
+        mode=mode, eta=eta, slack=slack, ranges=ranges, imbalance=imbalance
+    )
+    makespan, station_stats = run_simulation(
+        num_items, chosen, dict(variability), enable_jitter, arrival_jitter,
+        seed=seed, use_simpy=use_simpy,
+    )
+
+    if not makespan or makespan <= 0:
+        makespan = 0.0
+    total_busy = sum(s.busy for s in station_stats.values())
+    nstations = len(station_stats)
+
+    return SimResult(
+        makespan=makespan,
+        throughput=(num_items / makespan) if makespan > 0 else 0.0,
+        runtime_eff=(total_busy / (nstations * makespan)) if makespan > 0 else 0.0,
+        station_stats=station_stats,
+        chosen_times=chosen,
+        cycle_time=cycle,
+        efficiency=efficiency,
+        bottlenecks=bottlenecks,
+    )
+
+
+# =========================
+# Replications
+# =========================
+def simulate_once(seed, params):
+    # Module-level so worker processes can unpickle it; params are simulate() kwargs
+    return simulate(seed=seed, **params)
+
+def run_replications(params, n, seed=None, processes=None):
+    # Independent runs with per-replication seeds derived from one base seed,
+    # so a locked seed reproduces the whole batch
+    seeds = np.random.SeedSequence(seed).generate_state(n).tolist()
+    processes = min(n, processes or os.cpu_count() or 1)
+    if processes == 1:
+        return [simulate_once(s, params) for s in seeds]
+
+    chunksize = max(1, n // (processes * 4))
+    # spawn: workers import only this module, never the (threaded) UI process state
+    with multiprocessing.get_context("spawn").Pool(processes) as pool:
+        return list(pool.imap_unordered(partial(simulate_once, params=params), seeds, chunksize=chunksize))
+
+def summarize(results, field):
+    # Mean and 95% confidence half-width of one SimResult field across replications
+    values = np.array([getattr(r, field) for r in results], dtype=np.float64)
+    if len(values) < 2:
+        return float(values.mean()), 0.0
+    return float(values.mean()), float(1.96 * values.std(ddof=1) / math.sqrt(len(values)))
+
+
+# =========================
+# Command line (PyPy worker)
+# =========================
+def simulate_in(interpreter, seed=None, **params):
+    # Run simulate() under another interpreter, e.g. PyPy, whose JIT speeds up the
+    # pure-Python SimPy loop, and rebuild the SimResult from its JSON output.
+    # Starting the interpreter and importing numpy/simpy costs ~1 s, so this only
+    # pays off for SimPy runs of tens of thousands of items
+    out = subprocess.run(
+        [interpreter, "-m", "factory_core", json.dumps(dict(params, seed=seed))],
+        capture_output=True, text=True, check=True,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+    ).stdout
+    # The result is the last line; anything before it is log output (VERBOSE)
+    result = SimResult(**json.loads(out.splitlines()[-1]))
+    result.station_stats = {s: StationStats(*v) for s, v in result.station_stats.items()}
+    return result
+
+
+if __name__ == "__main__":
+    print(json.dumps(asdict(simulate(**json.loads(sys.argv[1])))))